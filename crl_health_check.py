@@ -5,225 +5,897 @@
 # Date: 2/6/2026
 # -------------------------------------------------------------
 
-from cryptography import x509
-from cryptography.x509 import ObjectIdentifier
 from colorama import Fore, Back, init
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 import requests
+import atexit
 import json
-from datetime import datetime, timedelta, timezone
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+# pywin32 is only available (and only needed) on Windows
+if sys.platform == "win32":
+    import pywintypes
+    import win32api
+    import win32con
+    import win32evtlog
+    import win32evtlogutil
+    import winerror
+
+class _NoColor:
+    """ Stands in for colorama's Fore / Back, where every color is an empty string. """
+
+    def __getattr__(self, name):
+        return ""
+
+# Headless runs (e.g. Task Scheduler) skip ANSI colors and colorama's stdout wrapper entirely
+if sys.stdout is not None and sys.stdout.isatty():
+    init(autoreset=True)
+else:
+    Fore = Back = _NoColor()
+
+# DER tags used while walking the CRL
+_TAG_BOOLEAN = 0x01
+_TAG_INTEGER = 0x02
+_TAG_UTC_TIME = 0x17
+_TAG_GENERALIZED_TIME = 0x18
+_TAG_CRL_EXTENSIONS = 0xA0
+
+# DER encoding of Microsoft's Next Publish CRL extension OID (1.3.6.1.4.1.311.21.4)
+_NEXT_PUBLISH_OID = b"\x2b\x06\x01\x04\x01\x82\x37\x15\x04"
+
+# The only CRL fields the health check consumes
+CRLHeader = namedtuple("CRLHeader", ["creation_date", "expiration_date", "next_publish"])
+
+# Outcome of checking a single CRL, reported once the whole batch is done (timestamps are 0 if unknown)
+CRLResult = namedtuple("CRLResult", [
+    "cdp_server", "crl_name", "full_path", "status_code", "log_message", "console_message",
+    "creation_ts", "overlap_ts", "expiration_ts"
+])
+
+_SECONDS_PER_DAY = 86400
+
+# Days before expiration a CRL is considered overlapping, incase it lacks the Next Publish extension
+_OVERLAP_FALLBACK_DAYS = 3
+
+# A single CRL's metrics within the Prometheus textfile
+PromEntry = namedtuple("PromEntry", [
+    "crl_file", "creation_date_timestamp", "overlapping_delta_timestamp", "expiration_date_timestamp", "status_code"
+])
+
+# Custom log of every CRL check
+_LOG_PATH = "C:/PKI/crl_monitoring.txt"
+
+# Textfile picked up by the windows_exporter textfile collector
+_PROM_LOG_PATH = "C:/Program Files/windows_exporter/textfile_input/crl_status.txt"
+
+# Static head of the Prometheus textfile, written once per file
+_PROM_HEADER = """
+# HELP crl_status Provides a viewpoint about the CRL
+# TYPE crl_status gauge
+"""
+
+# Windows event types (winnt.h), mirrored so the status table doesn't need pywin32
+_EVENTLOG_ERROR_TYPE = 0x0001
+_EVENTLOG_WARNING_TYPE = 0x0002
+_EVENTLOG_INFORMATION_TYPE = 0x0004
+
+# Status code -> (event type, console color, label)
+_STATUS_TABLE = {
+    1: (_EVENTLOG_INFORMATION_TYPE, Back.GREEN, "VALID"),
+    2: (_EVENTLOG_WARNING_TYPE, Back.YELLOW, "LAPSING"),
+    3: (_EVENTLOG_ERROR_TYPE, Back.RED, "EXPIRED"),
+    4: (_EVENTLOG_ERROR_TYPE, Back.RED, "UNREACHABLE"),
+    5: (_EVENTLOG_INFORMATION_TYPE, Back.GREEN, "LB REACHABLE"),
+    6: (_EVENTLOG_ERROR_TYPE, Back.RED, "LB UNREACHABLE"),
+    10: (_EVENTLOG_ERROR_TYPE, Back.RED, "BROKEN"),
+}
+
+# Any other status code is reported as an error
+_UNKNOWN_STATUS = (_EVENTLOG_ERROR_TYPE, Back.RED, "BROKEN")
+
+# Windows event source the script reports under, registered once per run
+_EVENT_SOURCE = "CRL Monitoring Script"
+_EVENT_SOURCE_KEY = f"SYSTEM\\CurrentControlSet\\Services\\EventLog\\Application\\{_EVENT_SOURCE}"
+_source_registered = False
+_event_source_handle = None
+
+# Events waiting to be reported, as (event type, status code, log content)
+_event_buffer = []
+
+# Remembers each CRL's validators and timestamps between runs, keyed by CRL URL
+_CRL_CACHE_PATH = "C:/PKI/crl_cache.json"
+
+# The cached CRL is reused without a request while it was checked within the max age,
+# and isn't within the margin of its Next Publish
+_CRL_CACHE_MAX_AGE = 4 * 3600
+_CRL_CACHE_MARGIN = 3600
+
+# Timestamp fields every cache entry must hold, besides its "etag" and "last_modified" validators
+_CRL_CACHE_TIMESTAMPS = ("checked_ts", "creation_ts", "overlap_ts", "expiration_ts")
+
+# Amount of bytes pulled off the CRL download per read
+_STREAM_CHUNK_SIZE = 8192
+
+# Amount of CRLs checked at the same time
+_MAX_WORKERS = 16
+
+# Shared keep-alive session, so connections to the CDP servers are reused between requests
+_HTTP_POOL_SIZE = 32
+_HTTP_TIMEOUT = (3, 10)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE))
+
+def _event_source_exists():
+    """
+        Checks the registry for the event source's key.
+
+        Returns:
+        True if the event source is already registered
+    """
+
+    try:
+        source_key = win32api.RegOpenKeyEx(win32con.HKEY_LOCAL_MACHINE, _EVENT_SOURCE_KEY, 0, win32con.KEY_READ)
+    except pywintypes.error:
+        return False
+
+    win32api.RegCloseKey(source_key)
+    return True
+
+def _get_event_source():
+    """
+        Registers the event source on first use, and opens a handle to it
+        that is kept for the rest of the run.
+
+        Returns:
+        Event source handle (None off Windows, where there is no event log)
+    """
 
-init(autoreset=True)
+    global _source_registered, _event_source_handle
+
+    if sys.platform != "win32":
+        return None
+
+    # Creates the Event Source only if it doesn't exist
+    if not _source_registered and not _event_source_exists():
+        try:
+            win32evtlogutil.AddSourceToRegistry(
+                appName=_EVENT_SOURCE,
+                eventLogType="Application"
+            )
+
+        # Registering needs admin rights, events are still reported without it
+        except pywintypes.error as error:
+            if error.winerror != winerror.ERROR_ACCESS_DENIED:
+                raise
+
+            print(f"Event Source {Fore.YELLOW}can't be registered{Fore.RESET}, access is denied.")
+
+    _source_registered = True
+
+    if _event_source_handle is None:
+        _event_source_handle = win32evtlog.RegisterEventSource(None, _EVENT_SOURCE)
+        atexit.register(win32evtlog.DeregisterEventSource, _event_source_handle)
+
+    return _event_source_handle
 
 def generate_windows_events(log_content, status_code):
     """
-        Generate windows event logs based on CRL status.
+        Buffers a windows event log based on CRL status, until flush_events() is called.
         
         Keyword arguments:
         log_content -- Description of CRL status
         status_code -- Status of the CRL File
     """
 
-    import win32evtlogutil
-    import win32evtlog
+    event_type, _, _ = _STATUS_TABLE.get(status_code, _UNKNOWN_STATUS)
+    _event_buffer.append((event_type, status_code, log_content))
 
-    # Tries creating Event Source if doesn't exist
-    try:
-        win32evtlogutil.AddSourceToRegistry(
-            appName="CRL Monitoring Script",
-            eventLogType="Application"
-        )
-    
-    # Incase source already exists
-    except:
-        print(f"Event Source {YELLOW}EXISTS.")
-
-    # Checks whether status code means that the CRL (or LB is 5) is valid
-    if status_code in [1, 5]:
-        event_type = win32evtlog.EVENTLOG_INFORMATION_TYPE
-
-    # Checks whether status code means CRL is due to expire
-    elif status_code == 2:
-        event_type = win32evtlog.EVENTLOG_WARNING_TYPE
-
-    # Checks whether status code means CRL is expired (or LB is unaccessible)
-    elif status_code in [3, 4, 6, 10]:
-        event_type = win32evtlog.EVENTLOG_ERROR_TYPE
-    else:
-        event_type = win32evtlog.EVENTLOG_ERROR_TYPE
-
-    # Create the event and add it to the event source
-    win32evtlogutil.ReportEvent(
-        appName="CRL Monitoring Script",
-        eventID=status_code,
-        eventType=event_type,
-        strings=[log_content],
-        data=None
-    )
+def flush_events():
+    """ Reports every buffered event to the event source in one go, events are dropped off Windows. """
+
+    if not _event_buffer:
+        return
+
+    # Windows event logs only exist on Windows
+    if sys.platform != "win32":
+        _event_buffer.clear()
+        return
 
+    event_source = _get_event_source()
+    report_event = win32evtlog.ReportEvent
 
-def datetime_to_unix(date):
+    # Create the events and add them to the event source
+    for event_type, status_code, log_content in _event_buffer:
+        report_event(event_source, event_type, 0, status_code, None, [log_content], None)
+
+    _event_buffer.clear()
+
+
+def _read_tlv_header(der, offset):
     """
-        Converts Date to Unix timestamp.
+        Reads the tag and length of a single DER element, without checking its value is present.
 
         Keyword arguments:
-        date -- Date object
+        der -- DER encoded data
+        offset -- Offset of the element's tag byte
 
         Returns:
-        timestamp
+        (tag, value_start, value_end)
     """
 
-    return int(date.timestamp())
+    if offset + 2 > len(der):
+        raise ValueError("Truncated DER element.")
 
-def clear_PROM_log():
-    """ Fetches the Prometheus text file, and clears it. """
+    tag = der[offset]
+    length = der[offset + 1]
+    offset += 2
 
-    try:
-        with open("C:/Program Files/windows_exporter/textfile_input/crl_status.txt", 'w+') as prom_file:
-            prom_file.write("")
-    except FileNotFoundError:
-        import os
-        os.makedirs(os.path.dirname("C:/Program Files/windows_exporter/textfile_input/crl_status.txt"))
+    # Long form length, the low bits hold the amount of length bytes
+    if length & 0x80:
+        length_size = length & 0x7F
+        length = int.from_bytes(der[offset:offset + length_size], "big")
+        offset += length_size
 
-def write_PROM_log(crl_file:str, creation_date_timestamp:int, overlapping_delta_timestamp:int, expiration_date_timestamp:int, status_code: int):
+    return tag, offset, offset + length
+
+def _read_tlv(der, offset):
     """
-        Writes current event into Prometheus textfile, for it to be picked up by the exporter
+        Reads the tag and length of a single DER element.
 
         Keyword arguments:
-        crl_file -- CRL file name
-        creation_date_timestamp -- The Unix timestamp of the Creation Day of the file
-        overlapping_delta_timestamp -- The Unix timestamp of the day of replacement of the CRL
-        expiration_date_timestamp -- The Unix timestamp of the Expiration Day of the file
-        status_code -- Represents the status of the CRL
+        der -- DER encoded data (memoryview)
+        offset -- Offset of the element's tag byte
+
+        Returns:
+        (tag, value_start, value_end)
     """
 
-    crl_file = crl_file.replace(".crl", "")
-    prom_log_format = f"""
-# HELP crl_status Provides a viewpoint about the CRL
-# TYPE crl_status gauge
-crl_status{{crl_name="{crl_file}"}} {status_code}
-crl_creation_date{{crl_name="{crl_file}"}} {creation_date_timestamp}
-crl_overlapping_date{{crl_name="{crl_file}"}} {overlapping_delta_timestamp}
-crl_expiration_date{{crl_name="{crl_file}"}} {expiration_date_timestamp}
-"""
+    tag, value_start, value_end = _read_tlv_header(der, offset)
+    if value_end > len(der):
+        raise ValueError("Truncated DER element.")
 
-    try:
-        with open("C:/Program Files/windows_exporter/textfile_input/crl_status.txt", 'a+') as prom_file:
-            prom_file.write(prom_log_format)
+    return tag, value_start, value_end
+
+class _CRLStream:
+    """
+        Reads a streamed CRL body on demand, so elements the parser skips over
+        are discarded instead of being held in memory.
+
+        Offsets are absolute, counted from the start of the CRL body.
+
+        Keyword arguments:
+        chunks -- Iterator over the CRL body's chunks (e.g. Response.iter_content)
+    """
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = bytearray()
+        self._base = 0
+
+    def _fill(self, end):
+        """ Reads from the body until the buffer reaches the given offset, or the body ends. """
+
+        while self._base + len(self._buffer) < end:
+            chunk = next(self._chunks, b"")
+            if not chunk:
+                break
+
+            self._buffer += chunk
+
+    def read_tlv(self, offset):
+        """
+            Reads the tag and length of the DER element at the given offset.
+
+            Returns:
+            (tag, value_start, value_end)
+        """
+
+        # Tag, length byte and up to 4 long form length bytes
+        self._fill(offset + 6)
+        tag, value_start, value_end = _read_tlv_header(self._buffer, offset - self._base)
+
+        return tag, value_start + self._base, value_end + self._base
+
+    def read(self, start, end):
+        """ Returns the bytes between the given offsets. """
+
+        self._fill(end)
+        if end > self._base + len(self._buffer):
+            raise ValueError("Truncated DER element.")
+
+        return bytes(self._buffer[start - self._base:end - self._base])
+
+    def skip(self, end):
+        """ Discards everything before the given offset without retaining it. """
+
+        while self._base + len(self._buffer) < end:
+            self._base += len(self._buffer)
+            self._buffer = bytearray(next(self._chunks, b""))
+
+            if not self._buffer:
+                raise ValueError("Truncated DER element.")
+
+        del self._buffer[:end - self._base]
+        self._base = end
+
+def _decode_time(tag, value):
+    """
+        Decodes a DER UTCTime / GeneralizedTime into an aware UTC datetime.
+
+        Keyword arguments:
+        tag -- DER tag of the time element
+        value -- Raw bytes of the time element
+
+        Returns:
+        datetime
+    """
+
+    text = bytes(value).decode("ascii")
+
+    # UTCTime holds a two digit year, RFC 5280 pivots it at 1950
+    if tag == _TAG_UTC_TIME:
+        year = int(text[:2])
+        text = f"{1900 + year if year >= 50 else 2000 + year}{text[2:]}"
+
+    elif tag != _TAG_GENERALIZED_TIME:
+        raise ValueError(f"Unexpected DER time tag {tag:#04x}.")
+
+    return datetime.strptime(text, "%Y%m%d%H%M%SZ").replace(tzinfo=timezone.utc)
+
+def _find_next_publish(extensions):
+    """
+        Scans the CRL extensions for Microsoft's Next Publish extension.
+
+        Keyword arguments:
+        extensions -- Contents of the crlExtensions [0] element (memoryview)
+
+        Returns:
+        Next Publish datetime, or None if the extension is missing
+    """
+
+    _, offset, extensions_end = _read_tlv(extensions, 0)
+    while offset < extensions_end:
+        _, field, offset = _read_tlv(extensions, offset)
+        _, oid_start, field = _read_tlv(extensions, field)
+
+        if extensions[oid_start:field] != _NEXT_PUBLISH_OID:
+            continue
+
+        # Skips the optional critical flag
+        tag, value_start, value_end = _read_tlv(extensions, field)
+        if tag == _TAG_BOOLEAN:
+            tag, value_start, value_end = _read_tlv(extensions, value_end)
+
+        # The extension's OCTET STRING wraps a single time element
+        tag, time_start, time_end = _read_tlv(extensions, value_start)
+        return _decode_time(tag, extensions[time_start:time_end])
+
+    return None
+
+def _parse_crl_header(crl_stream: _CRLStream):
+    """
+        Partially decodes a DER CRL, reading only the fields the health check needs.
+        The revoked certificates list is skipped over without being decoded or retained,
+        so the cost stays fixed regardless of the CRL's size.
+
+        Keyword arguments:
+        crl_stream -- Stream of the DER encoded CRL
+
+        Returns:
+        CRLHeader
+
+        Raises:
+        ValueError -- The CRL is malformed, or lacks a nextUpdate
+    """
+
+    # CertificateList -> tbsCertList
+    _, offset, _ = crl_stream.read_tlv(0)
+    _, offset, tbs_end = crl_stream.read_tlv(offset)
+
+    # Skips the optional version
+    tag, _, end = crl_stream.read_tlv(offset)
+    if tag == _TAG_INTEGER:
+        offset = end
+
+    # Skips the signature algorithm and the issuer
+    for _ in range(2):
+        _, _, offset = crl_stream.read_tlv(offset)
+
+    tag, start, offset = crl_stream.read_tlv(offset)
+    creation_date = _decode_time(tag, crl_stream.read(start, offset))
+    expiration_date = None
+    next_publish = None
+
+    # Walks the optional nextUpdate, revokedCertificates and crlExtensions
+    while offset < tbs_end:
+        tag, start, end = crl_stream.read_tlv(offset)
+
+        if tag in (_TAG_UTC_TIME, _TAG_GENERALIZED_TIME):
+            expiration_date = _decode_time(tag, crl_stream.read(start, end))
+
+        elif tag == _TAG_CRL_EXTENSIONS:
+            next_publish = _find_next_publish(memoryview(crl_stream.read(start, end)))
+
+        # Drops the revoked certificates as they come off the stream
+        else:
+            crl_stream.skip(end)
+
+        offset = end
+
+    # nextUpdate is optional in RFC 5280, but without it there's nothing to monitor
+    if expiration_date is None:
+        raise ValueError("CRL has no nextUpdate.")
+
+    return CRLHeader(creation_date, expiration_date, next_publish)
+
+def _format_timestamp(timestamp):
+    """
+        Formats a Unix timestamp the same way an aware UTC datetime prints.
 
-    except FileNotFoundError:
-        import os
-        os.makedirs(os.path.dirname("C:/Program Files/windows_exporter/textfile_input/crl_status.txt"))
+        Keyword arguments:
+        timestamp -- Unix timestamp
+
+        Returns:
+        Formatted date
+    """
+
+    return time.strftime("%Y-%m-%d %H:%M:%S+00:00", time.gmtime(timestamp))
+
+class PromWriter:
+    """
+        Writes a batch of entries into the Prometheus textfile through a single open file.
+        Entries go into a temporary file, which is synced to disk once and swapped in on exit,
+        so the exporter never reads a half written file.
+
+        Keyword arguments:
+        path -- Path of the Prometheus textfile (default=_PROM_LOG_PATH)
+    """
+
+    def __init__(self, path=_PROM_LOG_PATH):
+        self._path = path
+        self._prom_file = None
+
+    def __enter__(self):
+        self._prom_file = open(f"{self._path}.tmp", 'w')
+        self._prom_file.write(_PROM_HEADER)
+
+        return self
+
+    def write(self, entry):
+        """
+            Writes a single CRL's metrics.
+
+            Keyword arguments:
+            entry -- PromEntry of the CRL
+        """
+
+        crl_label = '{crl_name="' + entry.crl_file.replace(".crl", "") + '"} '
+        self._prom_file.write("".join([
+            "crl_status", crl_label, str(entry.status_code), "\n",
+            "crl_creation_date", crl_label, str(entry.creation_date_timestamp), "\n",
+            "crl_overlapping_date", crl_label, str(entry.overlapping_delta_timestamp), "\n",
+            "crl_expiration_date", crl_label, str(entry.expiration_date_timestamp), "\n"
+        ]))
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self._prom_file.flush()
+                os.fsync(self._prom_file.fileno())
+        finally:
+            self._prom_file.close()
+
+        # Keeps the previous textfile incase the batch failed midway
+        if exc_type is None:
+            os.replace(f"{self._path}.tmp", self._path)
+
+class _LogQueue:
+    """
+        Hands file writes off to a single background writer thread, so checking CRLs never blocks on disk.
+        Writes queued together are coalesced into a single write per file.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="crl-log-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, path, content):
+        """ Queues content to be appended to the file. """
+
+        self._queue.put((path, content, True))
+
+    def write_prom(self, entries):
+        """ Queues the Prometheus textfile to be rewritten with the entries. """
+
+        self._queue.put((_PROM_LOG_PATH, entries, False))
+
+    def join(self):
+        """
+            Blocks until every queued write has reached its file.
+
+            Raises:
+            The latest error the writer hit since the previous join, so failed writes aren't silently lost
+        """
+
+        self._queue.join()
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
 
-        with open("C:/Program Files/windows_exporter/textfile_input/crl_status.txt", 'a+') as log_file:
-            log_file.write(prom_log_format)
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
 
-def write_log(http_path, log_content, status_code):
+            # Drains whatever else got queued meanwhile
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+
+            # Keeps the writer alive no matter what, so join() always returns
+            except Exception as error:
+                self._error = error
+                print(f"{Fore.RED}Failed writing logs: {error}")
+
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch):
+        appends = {}
+        prom_entries = {}
+        for path, content, append in batch:
+            if append:
+                appends.setdefault(path, []).append(content)
+
+            # Only the latest batch matters for the Prometheus textfile
+            else:
+                prom_entries[path] = content
+
+        for path, contents in appends.items():
+            with open(path, 'a') as log_file:
+                log_file.write("".join(contents))
+
+        for path, entries in prom_entries.items():
+            with PromWriter(path) as prom_writer:
+                for entry in entries:
+                    prom_writer.write(entry)
+
+def _ensure_dirs():
+    """ Creates the log, cache and Prometheus textfile directories, so writers can open their files directly. """
+
+    for path in (_LOG_PATH, _CRL_CACHE_PATH, _PROM_LOG_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+_ensure_dirs()
+
+_LOG_QUEUE = _LogQueue()
+atexit.register(_LOG_QUEUE.join)
+
+def flush_PROM_log(entries: list):
     """
-        Writes a custom log into path (default='C:/PKI/crl_monitoring.txt').
+        Queues a rewrite of the Prometheus textfile with the whole batch, for it to be picked up by the exporter.
+        The file is replaced atomically (see PromWriter), so the exporter never reads a half written file.
+
+        Keyword arguments:
+        entries -- List of PromEntry, one per CRL
+    """
+
+    _LOG_QUEUE.write_prom(entries)
+
+def write_log(http_path, log_content, status_code, log_time=None):
+    """
+        Queues a custom log to be written into path (default='C:/PKI/crl_monitoring.txt').
 
         Keyword arguments:
         http_path -- Full CRL file path (CRL URL)
         log_content -- CRL Status description
         status_code -- Status of the CRL file
+        log_time -- Formatted time of the log, shared by a whole batch (default=now)
     """
 
+    if log_time is None:
+        log_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
     log_format = f"""
 {http_path}:
 ---- {log_content}
 ---- status code: {status_code}
----- time {datetime.now()}
+---- time {log_time}
 """
 
+    _LOG_QUEUE.append(_LOG_PATH, log_format)
+
+def _load_crl_cache():
+    """
+        Loads the CRL cache left by the previous run.
+
+        Returns:
+        Dictionary of CRL URL -> cache entry (empty if there is no usable cache)
+    """
+
+    try:
+        with open(_CRL_CACHE_PATH, 'r') as cache_file:
+            crl_cache = json.load(cache_file)
+
+    # Incase this is the first run, or the cache got corrupted
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if not isinstance(crl_cache, dict):
+        return {}
+
+    return crl_cache
+
+def _is_cache_entry(cached):
+    """
+        Checks whether a loaded cache entry holds every field, so that hand edited
+        or outdated entries are treated as a cache miss.
+
+        Keyword arguments:
+        cached -- Cache entry loaded from the CRL cache
+
+        Returns:
+        True if the entry can be used
+    """
+
+    return (
+        isinstance(cached, dict)
+        and "etag" in cached
+        and "last_modified" in cached
+        and all(isinstance(cached.get(field), (int, float)) for field in _CRL_CACHE_TIMESTAMPS)
+    )
+
+def _save_crl_cache(crl_cache):
+    """
+        Saves the CRL cache for the next run.
+
+        Keyword arguments:
+        crl_cache -- Dictionary of CRL URL -> cache entry
+    """
+
+    with open(f"{_CRL_CACHE_PATH}.tmp", 'w') as cache_file:
+        json.dump(crl_cache, cache_file)
+
+    os.replace(f"{_CRL_CACHE_PATH}.tmp", _CRL_CACHE_PATH)
+
+def _fetch_crl(full_path, crl_cache):
+    """
+        Fetches the CRL's timestamps, only downloading it when it might have changed since it was cached.
+
+        Keyword arguments:
+        full_path -- Full CRL file path (CRL URL)
+        crl_cache -- Dictionary of CRL URL -> cache entry, updated in place
+
+        Returns:
+        (http_status, (creation_ts, overlap_ts, expiration_ts)), the timestamps are None if the CRL is unreachable
+    """
+
+    cached = crl_cache.get(full_path)
+    if not _is_cache_entry(cached):
+        cached = None
+
+    now_ts = time.time()
+
+    # Skips the network while the CRL can't have been republished yet
+    if (cached is not None
+            and now_ts < cached["checked_ts"] + _CRL_CACHE_MAX_AGE
+            and now_ts < cached["overlap_ts"] - _CRL_CACHE_MARGIN):
+        return None, (cached["creation_ts"], cached["overlap_ts"], cached["expiration_ts"])
+
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        with open("C:/PKI/crl_monitoring.txt", 'a') as log_file:
-            log_file.write(log_format)
-    except FileNotFoundError:
-        import os
-        os.makedirs(os.path.dirname("C:/PKI/crl_monitoring.txt"))
+        crl_request = _SESSION.get(full_path, headers=headers, stream=True, timeout=_HTTP_TIMEOUT)
+
+    # Incase the CDP server can't be reached at all
+    except requests.RequestException:
+        return None, None
+
+    # Bodies are consumed before closing, so the connection is handed back to the pool
+    try:
+
+        # Reuses the cached parse incase the CRL didn't change
+        if crl_request.status_code == 304 and cached is not None:
+            crl_request.content
+            cached["checked_ts"] = now_ts
+
+            return 304, (cached["creation_ts"], cached["overlap_ts"], cached["expiration_ts"])
 
-        with open("C:/PKI/crl_monitoring.txt", 'a') as log_file:
-            log_file.write(log_format)
+        # Checks whether web request status code is anything but 200 (OK)
+        if int(crl_request.status_code) != 200:
+            crl_request.content
+            return crl_request.status_code, None
 
-def validate_crl(cdp_server, path_type, crl_name):
+        # Parses the CRL header straight off the download
+        crl_chunks = crl_request.iter_content(_STREAM_CHUNK_SIZE)
+        crl_data = _parse_crl_header(_CRLStream(crl_chunks))
+
+        # Drains what's left (only the signature)
+        for _ in crl_chunks:
+            pass
+
+    # Incase the CDP server stalls or resets midway through the body
+    except requests.RequestException:
+        return None, None
+
+    finally:
+        crl_request.close()
+
+    # Converts the dates once, everything after works on Unix timestamps
+    creation_ts = int(crl_data.creation_date.timestamp())
+    expiration_ts = int(crl_data.expiration_date.timestamp())
+
+    # Falls back incase the CRL lacks the Next Publish extension
+    if crl_data.next_publish is None:
+        overlap_ts = expiration_ts - _OVERLAP_FALLBACK_DAYS * _SECONDS_PER_DAY
+    else:
+        overlap_ts = int(crl_data.next_publish.timestamp())
+
+    crl_cache[full_path] = {
+        "etag": crl_request.headers.get("ETag"),
+        "last_modified": crl_request.headers.get("Last-Modified"),
+        "checked_ts": now_ts,
+        "creation_ts": creation_ts,
+        "overlap_ts": overlap_ts,
+        "expiration_ts": expiration_ts
+    }
+
+    return 200, (creation_ts, overlap_ts, expiration_ts)
+
+def _check_crl(cdp_server, path_type, crl_name, crl_cache):
     """
-        Builds the full CRL URL, downloads the CRL and examines it.
+        Builds the full CRL URL, fetches the CRL and examines it.
 
         Keyword arguments:
         cdp_server -- Name of the CDP server storing the CRL
         path_type -- Path type to navigate to (CertEnroll / CertData)
         crl_name -- Name of the CRL file
+        crl_cache -- Dictionary of CRL URL -> cache entry, updated in place
+
+        Returns:
+        CRLResult
     """
 
     full_path = f"https://{cdp_server}/{path_type}/{crl_name}"
-    crl_request = requests.get(full_path)
-    
-    # Checks whether web request status code is anything but 200 (OK)
-    if (int(crl_request.status_code) != 200):
-        crl_status = 4
-        log_message = "CRL is UNREACHABLE."
+    creation_ts = overlap_ts = expiration_ts = 0
+    delta_message = delta_days = None
+    parse_error = None
 
-        print(f"CRL is {Back.RED}UNREACHABLE{Back.RESET}.")
-        print(f"{Fore.YELLOW}CDP Server: {cdp_server}, CRL: {crl_name}")
-        write_log(full_path, "CRL is unreachable", crl_request.status_code)
+    try:
+        http_status, crl_timestamps = _fetch_crl(full_path, crl_cache)
 
-    else:
+    # Incase the CDP served something that isn't a valid CRL (e.g. an HTML error page)
+    except ValueError as error:
+        http_status = crl_timestamps = None
+        parse_error = error
 
-        # Parses the CRL file
-        crl_data = x509.load_der_x509_crl(crl_request.content)
+    if parse_error is not None:
+        crl_status = 10
+        log_message = f"CRL '{crl_name}' is BROKEN, it couldn't be parsed: {parse_error}"
 
-        creation_date = crl_data.last_update_utc
-        expiration_date = crl_data.next_update_utc
-        
-        # Tries fetching CRL's Next Publish extension
-        try:
-            overlapping_delta = crl_data.extensions.get_extension_for_oid(ObjectIdentifier("1.3.6.1.4.1.311.21.4")).value.value
-
-        except x509.ExtensionNotFound:
-            overlapping_delta = expiration_date - timedelta(days=3)
+    elif crl_timestamps is None:
+        crl_status = 4
+        log_message = f"CRL is UNREACHABLE (HTTP status: {http_status})."
 
-        current_date = datetime.now(timezone.utc)
+    else:
+        creation_ts, overlap_ts, expiration_ts = crl_timestamps
+        now_ts = int(time.time())
 
         # Checks whether CRL has reached Overlapping state by passing the date
-        if (current_date <= overlapping_delta):
+        if (now_ts <= overlap_ts):
             crl_status = 1
-            log_message = f"CRL '{crl_name}' is VALID, and is fresh until {overlapping_delta}."
+            log_message = f"CRL '{crl_name}' is VALID, and is fresh until {_format_timestamp(overlap_ts)}."
 
-            replacement_delta = abs(overlapping_delta - current_date).days
-            print(f"CRL is {Back.GREEN}VALID{Back.RESET} and should be replaced in {Back.GREEN}{replacement_delta} days{Back.RESET}.")
-            print(f"{Fore.YELLOW}CDP Server: {cdp_server}, CRL: {crl_name}")
+            delta_message = " and should be replaced in"
+            delta_days = abs(overlap_ts - now_ts) // _SECONDS_PER_DAY
 
         # Checks whether CRL has reached overlapping state, while staying smaller than Expiration
-        elif (current_date > overlapping_delta and current_date <= expiration_date):
+        elif (now_ts > overlap_ts and now_ts <= expiration_ts):
             crl_status = 2
-            log_message = f"CRL '{crl_name}' entered OVERLAPPING STATE, and will expire at {expiration_date}"
+            log_message = f"CRL '{crl_name}' entered OVERLAPPING STATE, and will expire at {_format_timestamp(expiration_ts)}"
 
-            expiration_delta = abs(expiration_date - current_date).days
-            print(f"CRL is {Back.YELLOW}LAPSING{Back.RESET} and will expire in {Back.YELLOW}{expiration_delta} days{Back.RESET}.")
-            print(f"{Fore.YELLOW}CDP Server: {cdp_server}, CRL: {crl_name}")
+            delta_message = " and will expire in"
+            delta_days = abs(expiration_ts - now_ts) // _SECONDS_PER_DAY
 
         # Checks whether the CRL file is expired
-        elif (current_date > expiration_date):
+        elif (now_ts > expiration_ts):
             crl_status = 3
-            log_message = f"CRL '{crl_name}' is EXPIRED since {expiration_date}"
+            log_message = f"CRL '{crl_name}' is EXPIRED since {_format_timestamp(expiration_ts)}"
 
-            past_expiration_delta = abs(current_date - expiration_date).days
-            print(f"CRL is {Back.RED}EXPIRED{Back.RESET}, and has been expired for {Back.RED}{past_expiration_delta} days{Back.RESET}.")
-            print(f"{Fore.YELLOW}CDP Server: {cdp_server}, CRL: {crl_name}")
+            delta_message = ", and has been expired for"
+            delta_days = abs(now_ts - expiration_ts) // _SECONDS_PER_DAY
 
         else:
             crl_status = 10
-            print(f"Script is {Back.RED}BROKEN </3")
-
-    write_log(http_path=full_path, log_content=log_message, status_code=crl_status)
-    clear_PROM_log()
-    write_PROM_log(
-        crl_file=crl_name, 
-        creation_date_timestamp=datetime_to_unix(creation_date),
-        overlapping_delta_timestamp=datetime_to_unix(overlapping_delta),
-        expiration_date_timestamp=datetime_to_unix(expiration_date),
-        status_code=crl_status
+            log_message = "Script is BROKEN."
+
+    _, color, label = _STATUS_TABLE.get(crl_status, _UNKNOWN_STATUS)
+    console_message = f"CRL is {color}{label}{Back.RESET}"
+    if delta_days is not None:
+        console_message += f"{delta_message} {color}{delta_days} days{Back.RESET}"
+    console_message += "."
+
+    return CRLResult(
+        cdp_server=cdp_server,
+        crl_name=crl_name,
+        full_path=full_path,
+        status_code=crl_status,
+        log_message=log_message,
+        console_message=console_message,
+        creation_ts=creation_ts,
+        overlap_ts=overlap_ts,
+        expiration_ts=expiration_ts
     )
 
-    generate_windows_events(log_content=log_message, status_code=crl_status)
+def validate_crl(crl_list):
+    """
+        Checks a batch of CRLs concurrently, then reports all of their results at once.
+
+        Keyword arguments:
+        crl_list -- List of (cdp_server, path_type, crl_name) tuples
+
+        Raises:
+        The latest error hit while writing the log or the Prometheus textfile, once the batch is reported
+    """
+
+    crl_cache = _load_crl_cache()
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        results = list(executor.map(lambda crl: _check_crl(*crl, crl_cache), crl_list))
+
+    # Prints in submission order, so each CRL's lines stay together
+    log_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    for result in results:
+        print(result.console_message)
+        print(f"{Fore.YELLOW}CDP Server: {result.cdp_server}, CRL: {result.crl_name}")
+        write_log(http_path=result.full_path, log_content=result.log_message, status_code=result.status_code, log_time=log_time)
+
+    # Rewrites the Prometheus textfile once for the whole batch
+    flush_PROM_log([
+        PromEntry(
+            crl_file=result.crl_name,
+            creation_date_timestamp=result.creation_ts,
+            overlapping_delta_timestamp=result.overlap_ts,
+            expiration_date_timestamp=result.expiration_ts,
+            status_code=result.status_code
+        )
+        for result in results
+    ])
+
+    for result in results:
+        generate_windows_events(log_content=result.log_message, status_code=result.status_code)
+
+    flush_events()
+
+    # Saved last, the cache is only an optimization and mustn't hold back the report
+    try:
+        _save_crl_cache(crl_cache)
+    except OSError as error:
+        print(f"{Fore.YELLOW}Failed saving the CRL cache: {error}")
+
+    # Waits for the batch's logs to reach disk
+    _LOG_QUEUE.join()
 
-validate_crl("c.pki.goog", "we2", "yK5nPhtHKQs.crl")
+if __name__ == "__main__":
+    validate_crl([
+        ("c.pki.goog", "we2", "yK5nPhtHKQs.crl"),
+    ])
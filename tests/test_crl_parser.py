@@ -0,0 +1,203 @@
+# -------------------------------------------------------------
+# File Name: test_crl_parser
+#
+# Tests for the partial DER CRL parser of crl_verifier
+# -------------------------------------------------------------
+
+from datetime import datetime, timezone
+import base64
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import crl_health_check
+
+# v2 CRL generated by openssl: UTCTime dates, 3 revoked certificates,
+# Next Publish (261020120000Z) and CRL Number extensions
+OPENSSL_CRL = base64.b64decode("""
+MIIBxjCBrwIBATANBgkqhkiG9w0BAQsFADARMQ8wDQYDVQQDDAZUZXN0Q0EXDTI2MTAxNDA2NTU0
+N1oXDTI2MTAyODA2NTU0N1owPDASAgEBFw0yNjEwMTQwNjU1NDdaMBICAQIXDTI2MTAxNDA2NTU0
+N1owEgIBAxcNMjYxMDE0MDY1NTQ3WqAsMCowHAYJKwYBBAGCNxUEBA8XDTI2MTAyMDEyMDAwMFow
+CgYDVR0UBAMCAQEwDQYJKoZIhvcNAQELBQADggEBAEasoWtepo1oOCNbM78LdyoXLMJh8NnPP/pr
+IbHLiLh3rFfxXhIV4rjdvtcBhVjylsnHngXoRnJiELw6naEAXQohzBVYHOhmgMA6iCLjRF4aXXB/
+jh14n9DmGifHxdkn3n4nT0+CH3leUo5MQoBoYIHNrMdNvNvXiVXytgZ5hkDjpjxjP5WP7cvdxTJb
+JM8kLbcBt8EDdc8BHY+JO509c2+ORN+dOElxO5AP4jXuebUif1Emq2CENDX/YZcY4DyPX6xxn22g
+vwfETog0JhYYIIjoKcjjmjRPSye0NjO3ixzCGQKldqrguoEqNuPbgvqMa5mWREGLKvebYRZipgWj
+RBI=
+""")
+
+# End of the openssl CRL's tbsCertList, the parser never reads past it
+OPENSSL_TBS_END = 182
+
+CRL_NUMBER_OID = b"\x55\x1d\x14"
+
+
+def tlv(tag, value):
+    """ Encodes a single DER element. """
+
+    if len(value) < 0x80:
+        length = bytes([len(value)])
+    else:
+        length_bytes = len(value).to_bytes((len(value).bit_length() + 7) // 8, "big")
+        length = bytes([0x80 | len(length_bytes)]) + length_bytes
+
+    return bytes([tag]) + length + value
+
+def utc_time(text):
+    return tlv(0x17, text)
+
+def generalized_time(text):
+    return tlv(0x18, text)
+
+def extension(oid, value, critical=False):
+    critical_flag = tlv(0x01, b"\xff") if critical else b""
+    return tlv(0x30, tlv(0x06, oid) + critical_flag + tlv(0x04, value))
+
+def next_publish(time_element, critical=False):
+    return extension(crl_health_check._NEXT_PUBLISH_OID, time_element, critical)
+
+def build_crl(this_update, next_update=None, version=True, revoked=0, extensions=None):
+    """
+        Builds a DER CRL, the signature is a placeholder since the parser doesn't verify it.
+
+        Keyword arguments:
+        this_update -- Encoded thisUpdate element
+        next_update -- Encoded nextUpdate element (default=None, left out)
+        version -- Whether to include the v2 version field (default=True)
+        revoked -- Amount of revoked certificate entries (default=0)
+        extensions -- List of encoded extensions (default=None, no crlExtensions)
+    """
+
+    tbs = tlv(0x02, b"\x01") if version else b""
+    tbs += tlv(0x30, tlv(0x06, b"\x2a\x86\x48\x86\xf7\x0d\x01\x01\x0b") + b"\x05\x00")
+    tbs += tlv(0x30, tlv(0x31, tlv(0x30, tlv(0x06, b"\x55\x04\x03") + tlv(0x0c, b"TestCA"))))
+    tbs += this_update
+
+    if next_update is not None:
+        tbs += next_update
+
+    if revoked:
+        entry = tlv(0x30, tlv(0x02, b"\x01\x02\x03") + utc_time(b"261001000000Z"))
+        tbs += tlv(0x30, entry * revoked)
+
+    if extensions is not None:
+        tbs += tlv(0xA0, tlv(0x30, b"".join(extensions)))
+
+    signature = tlv(0x30, b"\x06\x00") + tlv(0x03, b"\x00" + b"\x5a" * 64)
+    return tlv(0x30, tlv(0x30, tbs) + signature)
+
+def parse(der, chunk_size=8192):
+    """ Parses the DER CRL through _CRLStream, fed in chunks of the given size. """
+
+    chunks = (der[index:index + chunk_size] for index in range(0, len(der), chunk_size))
+    return crl_health_check._parse_crl_header(crl_health_check._CRLStream(chunks))
+
+def utc(*date):
+    return datetime(*date, tzinfo=timezone.utc)
+
+
+class ParseCRLHeaderTests(unittest.TestCase):
+
+    def test_openssl_crl(self):
+        for chunk_size in (1, 8192):
+            with self.subTest(chunk_size=chunk_size):
+                header = parse(OPENSSL_CRL, chunk_size)
+
+                self.assertEqual(header.creation_date, utc(2026, 10, 14, 6, 55, 47))
+                self.assertEqual(header.expiration_date, utc(2026, 10, 28, 6, 55, 47))
+                self.assertEqual(header.next_publish, utc(2026, 10, 20, 12, 0, 0))
+
+    def test_v1_crl(self):
+        der = build_crl(utc_time(b"261014000000Z"), utc_time(b"261028000000Z"), version=False, revoked=2)
+        header = parse(der)
+
+        self.assertEqual(header.creation_date, utc(2026, 10, 14))
+        self.assertEqual(header.expiration_date, utc(2026, 10, 28))
+        self.assertIsNone(header.next_publish)
+
+    def test_generalized_time(self):
+        der = build_crl(
+            generalized_time(b"20261014000000Z"),
+            generalized_time(b"20501028000000Z"),
+            extensions=[next_publish(generalized_time(b"20501020120000Z"))]
+        )
+        header = parse(der)
+
+        self.assertEqual(header.creation_date, utc(2026, 10, 14))
+        self.assertEqual(header.expiration_date, utc(2050, 10, 28))
+        self.assertEqual(header.next_publish, utc(2050, 10, 20, 12))
+
+    def test_utc_time_year_pivot(self):
+        der = build_crl(utc_time(b"500101000000Z"), utc_time(b"491231235959Z"))
+        header = parse(der)
+
+        self.assertEqual(header.creation_date, utc(1950, 1, 1))
+        self.assertEqual(header.expiration_date, utc(2049, 12, 31, 23, 59, 59))
+
+    def test_next_publish_among_other_extensions(self):
+        der = build_crl(
+            utc_time(b"261014000000Z"),
+            utc_time(b"261028000000Z"),
+            extensions=[
+                extension(CRL_NUMBER_OID, tlv(0x02, b"\x01")),
+                next_publish(utc_time(b"261020120000Z"), critical=True)
+            ]
+        )
+
+        self.assertEqual(parse(der).next_publish, utc(2026, 10, 20, 12))
+
+    def test_without_next_publish(self):
+        der = build_crl(
+            utc_time(b"261014000000Z"),
+            utc_time(b"261028000000Z"),
+            extensions=[extension(CRL_NUMBER_OID, tlv(0x02, b"\x01"))]
+        )
+
+        self.assertIsNone(parse(der).next_publish)
+
+    def test_missing_next_update(self):
+        der = build_crl(utc_time(b"261014000000Z"), extensions=[next_publish(utc_time(b"261020120000Z"))])
+
+        with self.assertRaises(ValueError):
+            parse(der)
+
+    def test_large_revoked_list(self):
+        der = build_crl(
+            utc_time(b"261014000000Z"),
+            utc_time(b"261028000000Z"),
+            revoked=5000,
+            extensions=[next_publish(utc_time(b"261020120000Z"))]
+        )
+
+        for chunk_size in (1, 8192):
+            with self.subTest(chunk_size=chunk_size):
+                header = parse(der, chunk_size)
+
+                self.assertEqual(header.expiration_date, utc(2026, 10, 28))
+                self.assertEqual(header.next_publish, utc(2026, 10, 20, 12))
+
+    def test_truncated_crl(self):
+        for length in range(OPENSSL_TBS_END):
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError):
+                    parse(OPENSSL_CRL[:length])
+
+    def test_non_der_bodies(self):
+        bodies = [
+            b"",
+            b"<html><body>Captive portal</body></html>",
+            b"-----BEGIN X509 CRL-----\nMIIBxjCBrw==\n-----END X509 CRL-----\n",
+            build_crl(utc_time(b"not a date!!!"), utc_time(b"261028000000Z")),
+        ]
+
+        for body in bodies:
+            for chunk_size in (1, 8192):
+                with self.subTest(body=body[:16], chunk_size=chunk_size):
+                    with self.assertRaises(ValueError):
+                        parse(body, chunk_size)
+
+
+if __name__ == "__main__":
+    unittest.main()